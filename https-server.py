@@ -1,42 +1,566 @@
-#!/usr/bin/python
+#!/usr/bin/env python3
 
 # You will need to generate the certs beforehand
 # openssl req -new -newkey rsa:4096 -x509 -sha256 -days 3650 -nodes -out server.crt -keyout server.key
+# Optionally add an ECDSA pair (-cert_ecdsa/-key_ecdsa), its handshakes cost a fraction of the RSA ones:
+# openssl req -new -newkey ec -pkeyopt ec_paramgen_curve:prime256v1 -x509 -sha256 -days 3650 -nodes -out server_ecdsa.crt -keyout server_ecdsa.key
 
 # Initialize as a client to download a file in the directory this file was run:
 # while true; do sudo wget --no-check-certificate --no-proxy --delete-after  https://192.168.1.20:4430/test.txt; done
 # You might need to type in the key file password on the server once a client request is made
+# Every wget process above pays a full TLS handshake; a client that keeps the connection open skips it entirely:
+# curl -k https://192.168.1.20:4430/test.txt -o /dev/null https://192.168.1.20:4430/test.txt -o /dev/null
 
-import BaseHTTPServer, SimpleHTTPServer
+# For zero-copy HTTPS the kernel TLS module has to be loaded (modprobe tls) and
+# Python must be 3.12+ built against OpenSSL 3.0+ (ssl.OP_ENABLE_KTLS)
+
+# To offload the handshake RSA/ECDH math to Intel QAT, point OpenSSL at a config that loads QAT_Engine:
+# OPENSSL_CONF=/etc/ssl/qat.cnf ./https-server.py
+# with qat.cnf containing an [engine_section] entry: qat = qat_section, and [qat_section] engine_id = qatengine, default_algorithms = ALL
+# Check the engine with: openssl engine -t -c qatengine
+
+# To let nginx do TLS in C (sendfile on; ssl_session_cache shared:SSL:10m;), serve plain HTTP on loopback:
+# ./https-server.py -http -bind 127.0.0.1 -port 8080
+# and in the nginx server block: listen 4430 ssl; ssl_certificate server.crt; ssl_certificate_key server.key; location / { proxy_pass http://127.0.0.1:8080; }
+
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from collections import OrderedDict
+import selectors
+import shutil
+import signal
+import socket
 import ssl
+import stat
+import sys
+import threading
 import argparse
+import datetime
+import email.utils
+import io
+import mimetypes
 import os.path
 
 
+# Buffer used when the file has to go through userspace (TLS), large enough to
+# amortize the per-call SSL_write overhead
+COPY_BUFSIZE = 1024 * 1024
+
+# Kernel send buffer for client sockets (inherited from the listening socket)
+SNDBUF_SIZE = 4 * 1024 * 1024
+
+# Pending TCP Fast Open requests the listening socket may queue
+FASTOPEN_QUEUE = 256
+
+# Files above this size are never held by the in-memory cache
+CACHE_MAX_FILE_SIZE = 8 * 1024 * 1024
+
+# Content types worth precompressing with -gzip, and the smallest file to bother with
+GZIP_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+GZIP_MIN_SIZE = 1024
+
+# Precomputed response headers are dropped wholesale once this many files have been seen
+HEADER_CACHE_SIZE = 4096
+
+# How much of a file to ask the kernel to start reading ahead before the send begins
+READAHEAD_SIZE = 64 * 1024 * 1024
+
+# Linux setsockopt level/option for kernel TLS, not exported by the socket module
+SOL_TLS = getattr(socket, "SOL_TLS", 282)
+TLS_TX = getattr(socket, "TLS_TX", 1)
+# sizeof(struct tls_crypto_info): version and cipher type only. The kernel accepts
+# just this or the full per-cipher struct, and this way no key material is copied out
+TLS_CRYPTO_INFO_SIZE = 4
+
+# TLS 1.2 suites the kernel can encrypt itself (TLS 1.3 AES-GCM works as is)
+KTLS_CIPHERS = "ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-RSA-AES128-GCM-SHA256:ECDHE-ECDSA-AES256-GCM-SHA384:ECDHE-RSA-AES256-GCM-SHA384"
+
+
+def ktls_tx_enabled(sock):
+    """Returns True if the kernel does the TLS encryption for data sent on sock."""
+    try:
+        sock.getsockopt(SOL_TLS, TLS_TX, TLS_CRYPTO_INFO_SIZE)
+    except OSError:
+        return False
+    return True
+
+
+def advise_sequential(fd, size):
+    """Tells the kernel fd is about to be read front to back, so it reads ahead
+    aggressively and starts on the first READAHEAD_SIZE bytes right away."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, min(size, READAHEAD_SIZE), os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def accepts_gzip(accept_encoding):
+    """Returns True if an Accept-Encoding header value allows gzip. An explicit
+    gzip entry wins over the * wildcard, whatever order they come in."""
+    allowed = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        allowed[name.strip().lower()] = params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    if "gzip" in allowed:
+        return allowed["gzip"]
+    return allowed.get("*", False)
+
+
+def precompress(directory):
+    """Writes a .gz next to every compressible file that lacks an up to date one.
+    Returns the number of files compressed."""
+    # Only needed with -gzip
+    import gzip
+
+    count = 0
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            ctype, encoding = mimetypes.guess_type(path)
+            if encoding or not ctype or not ctype.startswith(GZIP_TYPES):
+                continue
+            # Dangling symlinks, unreadable files and read-only directories are
+            # skipped rather than stopping the server from starting
+            tmp_path = path + ".gz.tmp"
+            try:
+                st = os.stat(path)
+                if st.st_size < GZIP_MIN_SIZE:
+                    continue
+                try:
+                    if os.stat(path + ".gz").st_mtime >= st.st_mtime:
+                        continue
+                except FileNotFoundError:
+                    pass
+
+                # Compress next to the target and rename, so a partial .gz is never served
+                with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+                os.replace(tmp_path, path + ".gz")
+            except OSError as e:
+                print("Not precompressing {0}: {1}".format(path, e.strerror or e))
+                if os.path.lexists(tmp_path):
+                    os.remove(tmp_path)
+                continue
+            count += 1
+    return count
+
+
+class FileCache:
+    """LRU cache of small file contents for the userspace (TLS) send path.
+
+    Entries are keyed by inode, size and mtime, so a file that changes on disk
+    simply misses and the stale copy ages out."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.used = 0
+
+    def read(self, source, st):
+        """Returns the contents of the open file source whose fstat() is st, or
+        None if it is too big to cache. Only st.st_size bytes are read, since that
+        is the Content-Length already sent; a file truncated since the fstat()
+        comes back short and is not cached."""
+        if st.st_size > min(self.max_bytes, CACHE_MAX_FILE_SIZE):
+            return None
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                return data
+
+        data = source.read(st.st_size)
+        if len(data) != st.st_size:
+            return data
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = data
+                self.used += len(data)
+            while self.used > self.max_bytes:
+                _, old = self.entries.popitem(last=False)
+                self.used -= len(old)
+        return data
+
+
+class FileServer(ThreadingHTTPServer):
+    """Thread per connection server whose client sockets get a larger send buffer."""
+
+    # Set when several worker processes each bind their own socket to the same port
+    reuse_port = False
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_SIZE)
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if hasattr(socket, "TCP_FASTOPEN"):
+            # Returning clients can send the request with the SYN
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_FASTOPEN, FASTOPEN_QUEUE)
+        super().server_bind()
+
+    def handle_error(self, request, client_address):
+        # Handshakes run in the connection thread, so plain HTTP sent to the TLS port,
+        # rejected certificates and scanners end up here; one line is enough for those
+        error = sys.exc_info()[1]
+        if not isinstance(error, (ssl.SSLError, ConnectionError)):
+            super().handle_error(request, client_address)
+            return
+        sys.stderr.write("{0} - - Connection dropped: {1}\n".format(client_address[0], error))
+
+
+class SendfileHandler(SimpleHTTPRequestHandler):
+    """Serves files with os.sendfile() when the kernel owns the whole send path:
+    plain TCP, or TLS offloaded to the kernel (kTLS)."""
+
+    # Keep-alive, so repeat downloads reuse the connection and its TLS session
+    protocol_version = "HTTP/1.1"
+    # Drops idle keep-alive connections instead of holding their thread forever
+    timeout = 60
+    # TCP_NODELAY; responses are coalesced with TCP_CORK instead
+    disable_nagle_algorithm = True
+    # FileCache for the userspace send path, None when disabled
+    file_cache = None
+    # Serve the .gz written by precompress() to gzip capable clients, set by -gzip
+    serve_gzip = False
+    # (path, inode, size, mtime) -> (Content-type, Content-Length, Last-Modified)
+    header_cache = {}
+    # Whether the kernel sends this connection's bytes itself (plain TCP or kTLS),
+    # worked out on the first response since it cannot change afterwards
+    zero_copy = None
+    # fstat() of the file the current response sends, if send_head() took one
+    file_stat = None
+
+    def cork(self, enabled):
+        """Holds back partial frames so headers and body leave in full segments."""
+        if not hasattr(socket, "TCP_CORK"):
+            return
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, enabled)
+        except OSError:
+            pass
+
+    def do_GET(self):
+        self.cork(True)
+        try:
+            super().do_GET()
+        finally:
+            self.cork(False)
+
+    def send_head(self):
+        self.file_stat = None
+        f = self.send_gzip_head() if self.serve_gzip else False
+        if f is False:
+            f = self.send_file_head()
+        return f
+
+    def send_file_head(self):
+        """send_head() for regular files, taking the size and mtime from the
+        open fd instead of stat()ing the path first. Directories, missing
+        files and trailing slash paths go to the stock send_head()."""
+        path = self.translate_path(self.path)
+        if path.endswith("/"):
+            return super().send_head()
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return super().send_head()
+
+        try:
+            fs = os.fstat(f.fileno())
+            if not stat.S_ISREG(fs.st_mode):
+                f.close()
+                return super().send_head()
+            if self.not_modified(fs.st_mtime):
+                self.send_response(304)
+                self.end_headers()
+                f.close()
+                return None
+
+            self.send_response(200)
+            for name, value in zip(("Content-type", "Content-Length", "Last-Modified"), self.file_headers(path, fs)):
+                self.send_header(name, value)
+            self.end_headers()
+            self.file_stat = fs
+            return f
+        except:
+            f.close()
+            raise
+
+    def file_headers(self, path, fs):
+        """Returns the Content-type, Content-Length and Last-Modified values for
+        a file, computing the mimetype lookup and date formatting once per version."""
+        key = (path, fs.st_ino, fs.st_size, fs.st_mtime_ns)
+        values = self.header_cache.get(key)
+        if values is None:
+            if len(self.header_cache) >= HEADER_CACHE_SIZE:
+                self.header_cache.clear()
+            values = (self.guess_type(path), str(fs.st_size), self.date_time_string(fs.st_mtime))
+            self.header_cache[key] = values
+        return values
+
+    def not_modified(self, mtime):
+        """Returns True if the client's If-Modified-Since copy is still current."""
+        if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        last_modified = datetime.datetime.fromtimestamp(int(mtime), datetime.timezone.utc)
+        return last_modified <= ims
+
+    def send_gzip_head(self):
+        """send_head() for the precompressed .gz of the requested file. Returns
+        it opened, None if a 304 was sent, or False when there is no usable .gz
+        and nothing has been sent."""
+        if not accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            return False
+        path = self.translate_path(self.path)
+        if path.endswith("/"):
+            return False
+        try:
+            f = open(path + ".gz", "rb")
+        except OSError:
+            return False
+
+        try:
+            fs = os.fstat(f.fileno())
+            st = os.stat(path)
+        except OSError:
+            f.close()
+            return False
+        # Directories keep their redirect, and a .gz older than the original is stale
+        if not stat.S_ISREG(fs.st_mode) or not stat.S_ISREG(st.st_mode) or fs.st_mtime < st.st_mtime:
+            f.close()
+            return False
+        if self.not_modified(st.st_mtime):
+            self.send_response(304)
+            self.end_headers()
+            f.close()
+            return None
+
+        self.send_response(200)
+        self.send_header("Content-type", self.guess_type(path))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(fs.st_size))
+        self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        self.file_stat = fs
+        return f
+
+    def copyfile(self, source, outputfile):
+        if isinstance(source, io.BytesIO):
+            # Directory listings are built in memory, there is no fd to send from
+            shutil.copyfileobj(source, outputfile)
+            return
+
+        if self.zero_copy is None:
+            self.zero_copy = hasattr(os, "sendfile") and (
+                not isinstance(self.connection, ssl.SSLSocket) or ktls_tx_enabled(self.connection))
+        fs = self.file_stat or os.fstat(source.fileno())
+        if not self.zero_copy:
+            data = self.file_cache.read(source, fs) if self.file_cache else None
+            if data is not None:
+                if len(data) == fs.st_size:
+                    outputfile.write(data)
+                else:
+                    self.close_connection = True
+            elif self.copy_through_buffer(source, outputfile, fs.st_size) > 0:
+                self.close_connection = True
+            return
+
+        # Headers may still be sitting in the write buffer
+        outputfile.flush()
+        in_fd = source.fileno()
+        out_fd = self.connection.fileno()
+        offset = 0
+        remaining = fs.st_size
+        advise_sequential(in_fd, remaining)
+        # A selector rather than select.select, which fails on fds above FD_SETSIZE
+        with selectors.DefaultSelector() as selector:
+            selector.register(out_fd, selectors.EVENT_WRITE)
+            while remaining > 0:
+                try:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                except BlockingIOError:
+                    # The socket timeout makes the fd non-blocking
+                    if not selector.select(self.timeout):
+                        raise socket.timeout("sendfile timed out")
+                    continue
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        if remaining > 0:
+            # The file shrank after the headers went out; the client can only
+            # tell the body is short if the connection ends
+            self.close_connection = True
+
+    def copy_through_buffer(self, source, outputfile, size):
+        """Userspace copy that reads into one reused buffer and hands slices of
+        it straight to the socket, instead of copyfileobj's new bytes per chunk.
+        Stops after size bytes, the Content-Length, even if the file has grown.
+        Returns how many of those bytes could not be sent because the file shrank."""
+        outputfile.flush()
+        advise_sequential(source.fileno(), size)
+        view = memoryview(bytearray(COPY_BUFSIZE))
+        remaining = size
+        while remaining > 0:
+            n = source.readinto(view[:min(remaining, COPY_BUFSIZE)])
+            if not n:
+                break
+            self.connection.sendall(view[:n])
+            remaining -= n
+        return remaining
+
+
 parser = argparse.ArgumentParser()
 parser.add_argument("-port", dest="port", type=int, default=4430, help="Port to run the server on. (Default: 4430)")
+parser.add_argument("-bind", dest="bind", type=str, default="0.0.0.0", help="Address to listen on. (Default: 0.0.0.0)")
 parser.add_argument("-cert", dest="cert", type=str, default="/local/labuser/certs/server.crt", help="SSL certificate file to use.")
 parser.add_argument("-key", dest="key", type=str, default="/local/labuser/certs/server.key", help="SSL key file to use.")
+parser.add_argument("-cert_ecdsa", dest="cert_ecdsa", type=str, default=None, help="Optional ECDSA certificate, preferred for clients that support it.")
+parser.add_argument("-key_ecdsa", dest="key_ecdsa", type=str, default=None, help="Key file for -cert_ecdsa.")
+parser.add_argument("-cache", dest="cache", type=int, default=64, help="MiB of small files to keep in memory for HTTPS, 0 to disable. (Default: 64)")
+parser.add_argument("-gzip", dest="gzip", action="store_true", help="Precompress text files in the served directory to .gz at startup.")
+parser.add_argument("-workers", dest="workers", type=int, default=1, help="Processes sharing the port through SO_REUSEPORT. (Default: 1)")
+parser.add_argument("-http", dest="http", action="store_true", help="Serve plain HTTP, e.g. behind a TLS terminating nginx.")
 settings = parser.parse_args()
 
-if not os.path.isfile(settings.cert):
-        print("Certificate file does not exist: ({0})".format(settings.cert))
-        print("Provide the file path to the cert file using -cert")
-        exit(1)
-if not os.path.isfile(settings.key):
-        print("Key file does not exist: ({0})".format(settings.key))
-        print("Provide the file path to the key file using -key")
+if not settings.http:
+        if not os.path.isfile(settings.cert):
+                print("Certificate file does not exist: ({0})".format(settings.cert))
+                print("Provide the file path to the cert file using -cert")
+                exit(1)
+        if not os.path.isfile(settings.key):
+                print("Key file does not exist: ({0})".format(settings.key))
+                print("Provide the file path to the key file using -key")
+                exit(1)
+        if settings.cert_ecdsa and not os.path.isfile(settings.cert_ecdsa):
+                print("ECDSA certificate file does not exist: ({0})".format(settings.cert_ecdsa))
+                exit(1)
+        if settings.cert_ecdsa and not (settings.key_ecdsa and os.path.isfile(settings.key_ecdsa)):
+                print("ECDSA key file does not exist: ({0})".format(settings.key_ecdsa))
+                print("Provide the file path to the ECDSA key file using -key_ecdsa")
+                exit(1)
+        if ssl.OPENSSL_VERSION_INFO < (1, 0, 1, 5):
+                print("OpenSSL is too old for AES-NI accelerated AES-GCM: ({0})".format(ssl.OPENSSL_VERSION))
+                print("Run the server with a Python linked against OpenSSL 1.0.1e or newer")
+                exit(1)
+        if "OPENSSL_ia32cap" in os.environ:
+                print("Warning: OPENSSL_ia32cap is set and may disable AES-NI/PCLMUL ({0})".format(os.environ["OPENSSL_ia32cap"]))
+if settings.workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        print("This platform does not support SO_REUSEPORT, run with -workers 1")
         exit(1)
 
 
-httpd = BaseHTTPServer.HTTPServer(('0.0.0.0', settings.port), SimpleHTTPServer.SimpleHTTPRequestHandler)
-httpd.socket = ssl.wrap_socket(httpd.socket, certfile=settings.cert, keyfile=settings.key, server_side=True)
+if settings.gzip:
+        print("Precompressed {0} files".format(precompress(os.getcwd())))
+
+SendfileHandler.serve_gzip = settings.gzip
+
+if settings.cache > 0:
+        SendfileHandler.file_cache = FileCache(settings.cache * 1024 * 1024)
+
+# Built before forking so every worker shares the session ticket keys,
+# otherwise a client resuming on a different worker pays a full handshake
+if not settings.http:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+        context.options |= getattr(ssl, "OP_ENABLE_KTLS", 0)
+        # Pick AES-GCM (AES-NI + PCLMUL) over the client's ChaCha20 preference
+        context.options |= ssl.OP_CIPHER_SERVER_PREFERENCE
+        # Client-initiated renegotiation would cost a full handshake per request
+        context.options |= ssl.OP_NO_RENEGOTIATION
+        # Session tickets let reconnecting TLS 1.3 clients resume without the RSA operation
+        context.num_tickets = 2
+        context.set_ciphers(KTLS_CIPHERS)
+        context.load_cert_chain(certfile=settings.cert, keyfile=settings.key)
+        if settings.cert_ecdsa:
+                # OpenSSL keeps one certificate per key type and picks by the client's signature algorithms
+                context.load_cert_chain(certfile=settings.cert_ecdsa, keyfile=settings.key_ecdsa)
+
+def reap_workers(signum, frame):
+    # Collect exited workers so they do not linger as zombies or get signalled again
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid == 0:
+            break
+        if children and pid in children:
+            children.remove(pid)
+
+# Each worker binds its own socket and the kernel spreads connections across them
+children = []
+signal.signal(signal.SIGCHLD, reap_workers)
+# Hold SIGCHLD until every pid is in children, so a worker that dies at once is still dropped
+signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+for _ in range(settings.workers - 1):
+        pid = os.fork()
+        if pid == 0:
+                children = None
+                break
+        children.append(pid)
+signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+FileServer.reuse_port = settings.workers > 1
+
+def reload_caches(signum, frame):
+    SendfileHandler.header_cache.clear()
+    if SendfileHandler.file_cache:
+        SendfileHandler.file_cache.clear()
+    for pid in children or ():
+        os.kill(pid, signal.SIGHUP)
+
+def stop_workers(signum, frame):
+    for pid in children or ():
+        os.kill(pid, signal.SIGTERM)
+    exit(0)
+
+signal.signal(signal.SIGHUP, reload_caches)
+signal.signal(signal.SIGTERM, stop_workers)
+
+httpd = FileServer((settings.bind, settings.port), SendfileHandler)
+if not settings.http:
+        # Leave the handshake to the connection's thread, otherwise it runs inside
+        # accept() and every client waits on the slowest handshake
+        httpd.socket = context.wrap_socket(httpd.socket, server_side=True, do_handshake_on_connect=False)
+
+if children is None:
+        # Only the first process prints the banner
+        httpd.serve_forever()
+        exit(0)
 
 print("")
-print("-------- HTTPS Server Started --------")
+if settings.http:
+        print("-------- HTTP Server Started ---------")
+else:
+        print("-------- HTTPS Server Started --------")
+print("Bind: {0}".format(settings.bind))
 print("Port: {0}".format(settings.port))
-print("Cert: {0}".format(settings.cert))
-print("Key : {0}".format(settings.key))
+if settings.workers > 1:
+        print("Proc: {0} workers".format(settings.workers))
+if not settings.http:
+        print("Cert: {0}".format(settings.cert))
+        print("Key : {0}".format(settings.key))
+        if settings.cert_ecdsa:
+                print("ECC : {0} (key {1})".format(settings.cert_ecdsa, settings.key_ecdsa))
+        print("SSL : {0}".format(ssl.OPENSSL_VERSION))
+        print("Mem : {0} MiB file cache".format(settings.cache))
+        if "OPENSSL_CONF" in os.environ:
+                print("Conf: {0}".format(os.environ["OPENSSL_CONF"]))
 print("--------------------------------------")
 print("")
 